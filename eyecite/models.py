@@ -52,10 +52,12 @@ class Edition:
         year: int,
     ) -> bool:
         """Return True if edition contains cases for the given year."""
+        # check the edition's own date range before asking for the time,
+        # since most editions are ruled out by it
         return (
-            year <= datetime.now().year
-            and (self.start is None or self.start.year <= year)
+            (self.start is None or self.start.year <= year)
             and (self.end is None or self.end.year >= year)
+            and year <= datetime.now().year
         )
 
 
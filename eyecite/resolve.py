@@ -1,7 +1,9 @@
 import re
 from collections import defaultdict
-from collections.abc import Callable
-from typing import cast
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Any, cast
 
 from eyecite.models import (
     CitationBase,
@@ -20,6 +22,88 @@ from eyecite.utils import strip_punct
 ResolvedFullCite = tuple[FullCitation, ResourceType]
 ResolvedFullCites = list[ResolvedFullCite]
 Resolutions = dict[ResourceType, list[CitationBase]]
+# resolves one citation within resolve_citations()
+_Handler = Callable[[Any], ResourceType | None]
+
+
+@dataclass
+class _AntecedentMatches:
+    """Distinct resources matching an antecedent guess among the first
+    `checked` rows of a _FullCiteTable. Kept per guess so that repeated
+    guesses only check full citations resolved since the last lookup."""
+
+    checked: int = 0
+    resources: list[ResourceType] = field(default_factory=list)
+
+
+@dataclass
+class _CaseCiteGroup:
+    """Rows of the full case citations sharing a reporter and volume, plus
+    their distinct resources (only the first two are kept, which is enough
+    to tell whether the group is ambiguous)."""
+
+    rows: list[int] = field(default_factory=list)
+    resources: list[ResourceType] = field(default_factory=list)
+    # resolutions of ambiguous short citations by antecedent guess; only
+    # valid until another row is added
+    by_antecedent: dict[str, ResourceType | None] = field(default_factory=dict)
+
+    def add(self, row: int, resource: ResourceType):
+        """Add a row, deduplicating its resource at insertion time. This
+        compares resources by equality, which is expensive for `Resource`,
+        so each row should only ever be added once, as resolve_citations()
+        does; it must not be repeated per lookup."""
+        self.rows.append(row)
+        if len(self.resources) < 2 and resource not in self.resources:
+            self.resources.append(resource)
+        self.by_antecedent.clear()
+
+
+@dataclass
+class _FullCiteTable:
+    """The full case citations resolved so far, indexed for the default
+    short case and supra citation resolvers. Other full citations (laws,
+    journals) can't be the antecedent of either, so they aren't stored.
+
+    Each resolved full case citation is a row, stored column-wise, so
+    matching an antecedent guess scans flat lists of party names rather than
+    reaching into each citation's metadata.
+    """
+
+    resources: list[ResourceType] = field(default_factory=list)
+    plaintiffs: list[str | None] = field(default_factory=list)
+    defendants: list[str | None] = field(default_factory=list)
+    # groups of full case citations by (corrected reporter, volume)
+    groups: dict[tuple[str, str | None], _CaseCiteGroup] = field(
+        default_factory=lambda: defaultdict(_CaseCiteGroup)
+    )
+    # matches found so far for each antecedent guess
+    antecedents: dict[str, _AntecedentMatches] = field(default_factory=dict)
+
+    def add(self, full_citation: FullCitation, resource: ResourceType):
+        """Add a row if full_citation is a newly resolved case citation."""
+        if not isinstance(full_citation, FullCaseCitation):
+            return
+        key = _reporter_volume_key(full_citation)
+        self.groups[key].add(len(self.resources), resource)
+        self.plaintiffs.append(full_citation.metadata.plaintiff)
+        self.defendants.append(full_citation.metadata.defendant)
+        self.resources.append(resource)
+
+    def resources_matching_antecedent(
+        self, rows: Iterable[int], ag: str
+    ) -> Iterator[ResourceType]:
+        """Yield the resources of the given rows whose defendant or plaintiff
+        contains the (punctuation-stripped) antecedent guess."""
+        defendants, plaintiffs = self.defendants, self.plaintiffs
+        resources = self.resources
+        for row in rows:
+            defendant = defendants[row]
+            plaintiff = plaintiffs[row]
+            if (defendant and ag in defendant) or (
+                plaintiff and ag in plaintiff
+            ):
+                yield resources[row]
 
 
 # Skip id. citations that imply a page length longer than this,
@@ -60,27 +144,39 @@ def resolve_full_citation(full_citation: FullCitation) -> Resource:
     return Resource(full_citation)
 
 
-def _filter_by_matching_antecedent(
-    resolved_full_cites: ResolvedFullCites,
-    antecedent_guess: str,
+@lru_cache(maxsize=2048)
+def _strip_punct_cached(antecedent_guess: str) -> str:
+    """Cache strip_punct(), since the same antecedent guesses tend to be
+    repeated throughout a document."""
+    return strip_punct(antecedent_guess)
+
+
+def _unique_resource(
+    resources: Iterable[ResourceType],
 ) -> ResourceType | None:
-    matches: list[ResourceType] = []
-    ag: str = strip_punct(antecedent_guess)
-    for full_citation, resource in resolved_full_cites:
+    """Return the resource if all of the given resources are the same one,
+    otherwise None. Stops as soon as a second distinct resource is found."""
+    unique: ResourceType | None = None
+    for i, resource in enumerate(resources):
+        if i == 0:
+            unique = resource
+        elif resource is not unique and resource != unique:
+            return None
+    return unique
+
+
+def _resources_matching_antecedent(
+    full_cites: Iterable[ResolvedFullCite], ag: str
+) -> Iterator[ResourceType]:
+    """Yield the resources of the full case citations whose defendant or
+    plaintiff contains the (punctuation-stripped) antecedent guess."""
+    for full_citation, resource in full_cites:
         if not isinstance(full_citation, FullCaseCitation):
             continue
-        if (
-            full_citation.metadata.defendant
-            and ag in full_citation.metadata.defendant
-        ) or (
-            full_citation.metadata.plaintiff
-            and ag in full_citation.metadata.plaintiff
-        ):
-            matches.append(resource)
-
-    # Remove duplicates and only accept if one candidate remains
-    matches = list(set(matches))
-    return matches[0] if len(matches) == 1 else None
+        metadata = full_citation.metadata
+        defendant, plaintiff = metadata.defendant, metadata.plaintiff
+        if (defendant and ag in defendant) or (plaintiff and ag in plaintiff):
+            yield resource
 
 
 def _filter_by_matching_plaintiff_or_defendant_or_resolved_names(
@@ -90,17 +186,19 @@ def _filter_by_matching_plaintiff_or_defendant_or_resolved_names(
     """Filter out reference citations that point to more than 1 Resource"""
     matches: list[ResourceType] = []
 
+    reference_metadata = reference_citation.metadata
     reference_values = set()
     for key in ReferenceCitation.name_fields:
-        reference_value = getattr(reference_citation.metadata, key)
+        reference_value = getattr(reference_metadata, key)
         if reference_value:
             reference_values.add(reference_value)
 
     for citation, resource in resolved_full_cites:
-        full_cite_values = {
-            value for value in citation.metadata.__dict__.values() if value
-        }
-        if full_cite_values & reference_values:
+        if any(
+            value in reference_values
+            for value in vars(citation.metadata).values()
+            if value
+        ):
             matches.append(resource)
 
     matches = list(set(matches))
@@ -145,9 +243,52 @@ def _has_invalid_pin_cite(
     return pin_cite < page or pin_cite > page + MAX_OPINION_PAGE_COUNT
 
 
+def _reporter_volume_key(
+    citation: FullCaseCitation | ShortCaseCitation,
+) -> tuple[str, str | None]:
+    """Return the key used to match short case citations to the full case
+    citations they may refer to."""
+    return citation.corrected_reporter(), citation.groups.get("volume")
+
+
+def _scan_shortcase_citation(
+    short_citation: ShortCaseCitation,
+    resolved_full_cites: ResolvedFullCites,
+) -> ResourceType | None:
+    """Resolve a short case citation without a full citation table, by
+    scanning the resolved full citations for ones sharing its reporter and
+    volume."""
+    key = _reporter_volume_key(short_citation)
+    candidates: ResolvedFullCites = [
+        (full_citation, resource)
+        for full_citation, resource in resolved_full_cites
+        if isinstance(full_citation, FullCaseCitation)
+        and _reporter_volume_key(full_citation) == key
+    ]
+    if not candidates:
+        return None
+
+    # Only accept if one candidate remains, ignoring duplicates
+    resource = _unique_resource(resource for _, resource in candidates)
+    if resource is not None:
+        return resource
+
+    # Otherwise, if there is an antecedent guess, try to refine further
+    if antecedent_guess := short_citation.metadata.antecedent_guess:
+        return _unique_resource(
+            _resources_matching_antecedent(
+                candidates, _strip_punct_cached(antecedent_guess)
+            )
+        )
+
+    # Otherwise, nothing left to try
+    return None
+
+
 def _resolve_shortcase_citation(
     short_citation: ShortCaseCitation,
     resolved_full_cites: ResolvedFullCites,
+    full_cite_table: _FullCiteTable | None = None,
 ) -> ResourceType | None:
     """
     Try to match shortcase citations by checking whether their reporter and
@@ -155,28 +296,30 @@ def _resolve_shortcase_citation(
     citations. If there are multiple possible matches, try to refine by also
     checking whether their antecedent_guess appears in either the defendant
     or plaintiff field of any of the previously resolved full citations.
+
+    resolve_citations() passes full_cite_table, which indexes the resolved
+    full case citations by reporter and volume, so candidates can be looked
+    up directly. If it is not given (e.g. when a custom resolver falls back
+    to this one), resolved_full_cites is scanned instead.
     """
-    candidates: ResolvedFullCites = []
-    for full_citation, resource in resolved_full_cites:
-        if (
-            isinstance(full_citation, FullCaseCitation)
-            and short_citation.corrected_reporter()
-            == full_citation.corrected_reporter()
-            and short_citation.groups.get("volume")
-            == full_citation.groups.get("volume")
-        ):
-            # Append both keys and values for further refinement below
-            candidates.append((full_citation, resource))
+    if full_cite_table is None:
+        return _scan_shortcase_citation(short_citation, resolved_full_cites)
+    group = full_cite_table.groups.get(_reporter_volume_key(short_citation))
+    if group is None:
+        return None
 
-    # Remove duplicates and only accept if one candidate remains
-    if len({resource for full_citation, resource in candidates}) == 1:
-        return candidates[0][1]
+    # Only accept if one candidate remains, ignoring duplicates
+    if len(group.resources) == 1:
+        return group.resources[0]
 
     # Otherwise, if there is an antecedent guess, try to refine further
-    elif short_citation.metadata.antecedent_guess:
-        return _filter_by_matching_antecedent(
-            candidates, short_citation.metadata.antecedent_guess
-        )
+    elif antecedent_guess := short_citation.metadata.antecedent_guess:
+        if antecedent_guess not in group.by_antecedent:
+            ag: str = _strip_punct_cached(antecedent_guess)
+            group.by_antecedent[antecedent_guess] = _unique_resource(
+                full_cite_table.resources_matching_antecedent(group.rows, ag)
+            )
+        return group.by_antecedent[antecedent_guess]
 
     # Otherwise, nothing left to try
     else:
@@ -186,19 +329,55 @@ def _resolve_shortcase_citation(
 def _resolve_supra_citation(
     supra_citation: SupraCitation,
     resolved_full_cites: ResolvedFullCites,
+    full_cite_table: _FullCiteTable | None = None,
 ) -> ResourceType | None:
     """
     Try to resolve supra citations by checking whether their antecedent_guess
     appears in either the defendant or plaintiff field of any of the
     previously resolved full citations.
+
+    resolve_citations() passes full_cite_table, which remembers the matches
+    found for each antecedent guess so far; only full citations resolved
+    since the last lookup of the same guess then need to be checked. If it
+    is not given (e.g. when a custom resolver falls back to this one),
+    resolved_full_cites is scanned instead.
     """
     # If no guess, can't do anything
-    if not supra_citation.metadata.antecedent_guess:
+    antecedent_guess = supra_citation.metadata.antecedent_guess
+    if not antecedent_guess:
         return None
 
-    return _filter_by_matching_antecedent(
-        resolved_full_cites, supra_citation.metadata.antecedent_guess
+    if full_cite_table is None:
+        return _unique_resource(
+            _resources_matching_antecedent(
+                resolved_full_cites, _strip_punct_cached(antecedent_guess)
+            )
+        )
+
+    # Nor if there is no full case citation yet to refer to
+    if not full_cite_table.resources:
+        return None
+
+    matches = full_cite_table.antecedents.setdefault(
+        antecedent_guess, _AntecedentMatches()
     )
+    row_count = len(full_cite_table.resources)
+
+    # Only check full citations resolved since the last lookup, and only
+    # while the guess is unambiguous -- later full citations can't make it
+    # unique again
+    if matches.checked < row_count and len(matches.resources) < 2:
+        ag: str = _strip_punct_cached(antecedent_guess)
+        for resource in full_cite_table.resources_matching_antecedent(
+            range(matches.checked, row_count), ag
+        ):
+            if resource not in matches.resources:
+                matches.resources.append(resource)
+                if len(matches.resources) > 1:
+                    break
+    matches.checked = row_count
+
+    return matches.resources[0] if len(matches.resources) == 1 else None
 
 
 def _resolve_reference_citation(
@@ -212,11 +391,12 @@ def _resolve_reference_citation(
     resolved_case_name_short or resolved_case_name
     field of any of the previously resolved full citations.
     """
+    metadata = reference_citation.metadata
     if (
-        not reference_citation.metadata.defendant
-        and not reference_citation.metadata.plaintiff
-        and not reference_citation.metadata.resolved_case_name_short
-        and not reference_citation.metadata.resolved_case_name
+        not metadata.defendant
+        and not metadata.plaintiff
+        and not metadata.resolved_case_name_short
+        and not metadata.resolved_case_name
     ):
         return None
     return _filter_by_matching_plaintiff_or_defendant_or_resolved_names(
@@ -309,49 +489,95 @@ def resolve_citations(
             to lists of `eyecite.models.CitationBase` objects (the values).
     """
     # Dict of all citation resolutions
-    resolutions: Resolutions = defaultdict(list)
+    resolutions: Resolutions = {}
 
-    # Dict mapping full citations to their resolved resources
+    # List of full citations and their resolved resources
     resolved_full_cites: ResolvedFullCites = []
 
+    # The same full citations, indexed for the default short case and supra
+    # citation resolvers so they don't have to scan them all
+    full_cite_table = _FullCiteTable()
+
     # The resource of the most recently resolved citation, if any
     last_resolution: ResourceType | None = None
+    default_id_resolver = resolve_id_citation is _resolve_id_citation
+
+    def _resolve_full(citation: FullCitation) -> ResourceType | None:
+        resolution = resolve_full_citation(citation)
+        resolved_full_cites.append((citation, resolution))
+        full_cite_table.add(citation, resolution)
+        return resolution
+
+    def _resolve_id(citation: IdCitation) -> ResourceType | None:
+        # The default resolver fails any id. citation after a failed
+        # resolution, so don't call it just to find that out
+        if not last_resolution and default_id_resolver:
+            return None
+        return resolve_id_citation(citation, last_resolution, resolutions)
+
+    def _with_full_cites(resolver: Callable[..., ResourceType | None]):
+        """Adapt a resolver that also takes the resolved full citations."""
+        return lambda citation: resolver(citation, resolved_full_cites)
+
+    # The default resolvers are the common case, so bind their arguments
+    # (including the full citation table) and call them directly; custom
+    # resolvers get the documented (citation, resolved_full_cites) call
+    _resolve_shortcase: _Handler
+    if resolve_shortcase_citation is _resolve_shortcase_citation:
+        _resolve_shortcase = partial(
+            _resolve_shortcase_citation,
+            resolved_full_cites=resolved_full_cites,
+            full_cite_table=full_cite_table,
+        )
+    else:
+        _resolve_shortcase = _with_full_cites(resolve_shortcase_citation)
+
+    _resolve_supra: _Handler
+    if resolve_supra_citation is _resolve_supra_citation:
+        _resolve_supra = partial(
+            _resolve_supra_citation,
+            resolved_full_cites=resolved_full_cites,
+            full_cite_table=full_cite_table,
+        )
+    else:
+        _resolve_supra = _with_full_cites(resolve_supra_citation)
 
-    # Iterate over each citation and attempt to resolve it to a resource
-    for citation in citations:
-        # If the citation is a full citation, try to resolve it
-        if isinstance(citation, FullCitation):
-            resolution = resolve_full_citation(citation)
-            resolved_full_cites.append((citation, resolution))
-
-        # If the citation is a short case citation, try to resolve it
-        elif isinstance(citation, ShortCaseCitation):
-            resolution = resolve_shortcase_citation(
-                citation, resolved_full_cites
-            )
+    _resolve_reference: _Handler
+    if resolve_reference_citation is _resolve_reference_citation:
+        _resolve_reference = partial(
+            _resolve_reference_citation,
+            resolved_full_cites=resolved_full_cites,
+        )
+    else:
+        _resolve_reference = _with_full_cites(resolve_reference_citation)
 
-        # If the citation is a supra citation, try to resolve it
-        elif isinstance(citation, SupraCitation):
-            resolution = resolve_supra_citation(citation, resolved_full_cites)
+    # How to resolve each kind of citation, in order of precedence
+    handlers: list[tuple[type, _Handler]] = [
+        (FullCitation, _resolve_full),
+        (ShortCaseCitation, _resolve_shortcase),
+        (SupraCitation, _resolve_supra),
+        (ReferenceCitation, _resolve_reference),
+        (IdCitation, _resolve_id),
+    ]
 
-        elif isinstance(citation, ReferenceCitation):
-            resolution = resolve_reference_citation(
-                citation, resolved_full_cites
-            )
+    # The handler for each concrete citation class, found on first use so
+    # that each citation takes a single dict lookup
+    handlers_by_class: dict[type, _Handler] = {}
 
-        # If the citation is an id citation, try to resolve it
-        elif isinstance(citation, IdCitation):
-            resolution = resolve_id_citation(
-                citation, last_resolution, resolutions
+    # Iterate over each citation and attempt to resolve it to a resource
+    for citation in citations:
+        handler = handlers_by_class.get(type(citation))
+        if handler is None:
+            handler = handlers_by_class[type(citation)] = next(
+                (h for cls, h in handlers if isinstance(citation, cls)),
+                # If the citation is to an unknown document, ignore for now
+                lambda citation: None,
             )
-
-        # If the citation is to an unknown document, ignore for now
-        else:
-            resolution = None
+        resolution = handler(citation)
 
         last_resolution = resolution
         if resolution:
             # Record the citation in the appropriate list
-            resolutions[resolution].append(citation)
+            resolutions.setdefault(resolution, []).append(citation)
 
     return resolutions
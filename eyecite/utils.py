@@ -108,33 +108,47 @@ DISALLOWED_NAMES = [
 ]
 
 
+# Patterns used by strip_punct(), compiled once. Steps that only delete
+# single characters use str.translate() tables instead.
+_STRIP_PUNCT_LEADING_QUOTE_RE = re.compile(r"^[\"\']")
+_STRIP_PUNCT_OPENING_QUOTE_RE = re.compile(r'([ (\[{<])"')
+_STRIP_PUNCT_FINAL_PERIOD_RE = re.compile(r'([^\.])(\.)([\]\)}>"\']*)\s*$')
+_STRIP_PUNCT_APOSTROPHE_RE = re.compile(r"([^'])' ")
+_STRIP_PUNCT_ENDING_QUOTE_RE = re.compile(r"(\S)(\'\'?)")
+_STRIP_PUNCT_SEPARATORS = str.maketrans("", "", ",;:@#$%&")
+_STRIP_PUNCT_MARKS = str.maketrans("", "", "?!")
+_STRIP_PUNCT_BRACKETS = str.maketrans("", "", "[](){}<>")
+
+
 def strip_punct(text: str) -> str:
     """Strips punctuation from a given string
     Adapted from nltk Penn Treebank tokenizer
 
+    Each step depends on the ones before it, so they must stay in order.
+
     :param str: The raw string
     :return: The stripped string
     """
     # starting quotes
-    text = re.sub(r"^[\"\']", r"", text)
-    text = re.sub(r"(``)", r"", text)
-    text = re.sub(r'([ (\[{<])"', r"", text)
+    text = _STRIP_PUNCT_LEADING_QUOTE_RE.sub("", text)
+    text = text.replace("``", "")
+    text = _STRIP_PUNCT_OPENING_QUOTE_RE.sub("", text)
 
     # punctuation
-    text = re.sub(r"\.\.\.", r"", text)
-    text = re.sub(r"[,;:@#$%&]", r"", text)
-    text = re.sub(r'([^\.])(\.)([\]\)}>"\']*)\s*$', r"\1", text)
-    text = re.sub(r"[?!]", r"", text)
+    text = text.replace("...", "")
+    text = text.translate(_STRIP_PUNCT_SEPARATORS)
+    text = _STRIP_PUNCT_FINAL_PERIOD_RE.sub(r"\1", text)
+    text = text.translate(_STRIP_PUNCT_MARKS)
 
-    text = re.sub(r"([^'])' ", r"", text)
+    text = _STRIP_PUNCT_APOSTROPHE_RE.sub("", text)
 
     # parens, brackets, etc.
-    text = re.sub(r"[\]\[\(\)\{\}\<\>]", r"", text)
-    text = re.sub(r"--", r"", text)
+    text = text.translate(_STRIP_PUNCT_BRACKETS)
+    text = text.replace("--", "")
 
     # ending quotes
-    text = re.sub(r'"', "", text)
-    text = re.sub(r"(\S)(\'\'?)", r"\1", text)
+    text = text.replace('"', "")
+    text = _STRIP_PUNCT_ENDING_QUOTE_RE.sub(r"\1", text)
 
     return text.strip()
 
@@ -5,7 +5,11 @@ from eyecite import get_citations
 from eyecite.find import extract_reference_citations
 from eyecite.helpers import filter_citations
 from eyecite.models import Document, FullCitation, Resource
-from eyecite.resolve import resolve_citations
+from eyecite.resolve import (
+    _resolve_shortcase_citation,
+    _resolve_supra_citation,
+    resolve_citations,
+)
 
 
 def format_resolution(resolution):
@@ -206,6 +210,14 @@ class ResolveTest(TestCase):
             (1, "Foo v. Bar, 1 U.S. 2."),
             (None, "Foo, supra, at 2."),
         )
+        # Test resolving the same supra citation before and after a second
+        # candidate appears. Only the first should be resolved.
+        self.checkResolution(
+            (0, "Foo v. Bar, 1 U.S. 1."),
+            (0, "Foo, supra, at 2."),
+            (1, "Foo v. Bar, 1 U.S. 2."),
+            (None, "Foo, supra, at 2."),
+        )
 
     def test_short_resolution(self):
         # Test resolving a short form citation
@@ -226,6 +238,16 @@ class ResolveTest(TestCase):
             (1, "Wrong v. Wrong, 1 U.S. 2."),
             (0, "Foo, 1 U.S., at 2."),
         )
+        # Test resolving the same short form citation before and after
+        # another candidate matching its antecedent guess appears. Only the
+        # first should be resolved.
+        self.checkResolution(
+            (0, "Foo v. Bar, 1 U.S. 1."),
+            (1, "Wrong v. Wrong, 1 U.S. 2."),
+            (0, "Foo, 1 U.S., at 2."),
+            (2, "Foo v. Baz, 1 U.S. 3."),
+            (None, "Foo, 1 U.S., at 2."),
+        )
         # Test resolving a short form citation when its reporter and
         # volume match two possible candidates, and when it lacks a
         # meaningful antecedent. We expect the short form citation to not
@@ -386,3 +408,44 @@ class ResolveTest(TestCase):
             # resolved
         ):
             self.checkReferenceResolution(*test_tuple)
+
+    def test_default_resolvers_as_fallback(self):
+        """Can custom resolvers fall back to the default resolvers, which are
+        then called without the indexes built by resolve_citations()?"""
+        citations = [
+            cite
+            for text in (
+                "Foo v. Bar, 1 U.S. 1.",
+                "Wrong v. Wrong, 1 U.S. 2.",
+                "Foo, 1 U.S., at 2.",
+                "Id. at 3.",
+                "Wrong, supra, at 3.",
+                "2 U.S., at 2.",
+            )
+            for cite in get_citations(text)
+        ]
+
+        def my_resolve_shortcase(short_citation, resolved_full_cites):
+            return _resolve_shortcase_citation(
+                short_citation, resolved_full_cites
+            )
+
+        def my_resolve_supra(supra_citation, resolved_full_cites):
+            return _resolve_supra_citation(supra_citation, resolved_full_cites)
+
+        resolution = resolve_citations(
+            citations,
+            resolve_shortcase_citation=my_resolve_shortcase,
+            resolve_supra_citation=my_resolve_supra,
+        )
+        self.assertEqual(
+            format_resolution(resolution),
+            {
+                "1 U.S. 1": ["1 U.S. 1", "1 U.S., at 2", "Id."],
+                "1 U.S. 2": ["1 U.S. 2", "supra,"],
+            },
+        )
+        self.assertEqual(
+            format_resolution(resolution),
+            format_resolution(resolve_citations(citations)),
+        )